@@ -1,5 +1,11 @@
+from functools import lru_cache
+from math import cos, radians
 from pathlib import Path
 
+import numpy as np
+
+from code.helpers import EARTH_RADIUS_KM
+
 
 LAT_IDX, LON_IDX = 14, 15
 
@@ -9,8 +15,14 @@ GLOBAL_AIRPORT_DB_PATH = ROOT_DIR / "data/GlobalAirportDatabase.txt"
 DESTINATIONS_CSV_PATH = ROOT_DIR / "data/destinations.csv"
 
 
+@lru_cache(maxsize=1)
 def load_airports_positions() -> dict[str, tuple[float, float]]:
     """Loads the airport locations from a local text file into a dictionary.
+        The whole file is read in one go and split in memory, avoiding
+        per-line buffered reads; the result is cached so the file is only
+        parsed once per run. A binary .npz snapshot is also kept beside the
+        text file and refreshed whenever the text file changes, so warm
+        starts load the arrays directly instead of re-parsing the text.
 
     Returns
     ----------
@@ -23,22 +35,56 @@ def load_airports_positions() -> dict[str, tuple[float, float]]:
     The Global Airport Database can be found here:
     https://www.partow.net/miscellaneous/airportdatabase/index.html#Downloads
     """
+    cache_path = GLOBAL_AIRPORT_DB_PATH.with_suffix(".npz")
+    if (
+        cache_path.exists()
+        and cache_path.stat().st_mtime >= GLOBAL_AIRPORT_DB_PATH.stat().st_mtime
+    ):
+        cached = np.load(cache_path)
+        return dict(
+            zip(
+                cached["icao"].tolist(),
+                zip(cached["lat"].tolist(), cached["lon"].tolist()),
+            )
+        )
     coordinates = {}
-    with open(GLOBAL_AIRPORT_DB_PATH, "r", encoding="utf-8") as airports:
-        for airport in airports:
-            line = airport.strip()
-            if not line:
-                continue
-            details = line.split(":")
-            icao_code = details[0]
-            latitude = float(details[LAT_IDX])
-            longitude = float(details[LON_IDX])
-            coordinates[icao_code] = (latitude, longitude)
+    with open(GLOBAL_AIRPORT_DB_PATH, "rb") as airports:
+        data = airports.read()
+    for line in data.split(b"\n"):
+        line = line.strip()
+        if not line:
+            continue
+        details = line.split(b":", LON_IDX + 1)
+        icao_code = details[0].decode("utf-8")
+        latitude = float(details[LAT_IDX])
+        longitude = float(details[LON_IDX])
+        coordinates[icao_code] = (latitude, longitude)
+    try:
+        np.savez(
+            cache_path,
+            icao=np.array(list(coordinates), dtype=str),
+            lat=np.fromiter(
+                (position[0] for position in coordinates.values()),
+                dtype=np.float64,
+                count=len(coordinates),
+            ),
+            lon=np.fromiter(
+                (position[1] for position in coordinates.values()),
+                dtype=np.float64,
+                count=len(coordinates),
+            ),
+        )
+    except OSError:
+        # the snapshot only speeds up the next run; an unwritable data
+        # directory must not break plain loading
+        pass
     return coordinates
 
 
+@lru_cache(maxsize=1)
 def load_airport_data() -> dict[str, tuple[str, str, str, str]]:
     """Loads the airport data from a local CSV file into a tuple.
+        The result is cached so the file is only parsed once per run.
 
     Returns
     ----------
@@ -57,6 +103,98 @@ def load_airport_data() -> dict[str, tuple[str, str, str, str]]:
     return data
 
 
+@lru_cache(maxsize=1)
+def load_airports_table() -> tuple[dict[str, int], np.ndarray, np.ndarray]:
+    """Loads the airport coordinates into a structure-of-arrays layout:
+        two contiguous NumPy arrays of latitudes and longitudes plus a
+        dictionary mapping each ICAO code to its row index. This keeps
+        per-airport lookups O(1) and lets distance computations run
+        vectorized over whole arrays instead of per-airport Python tuples.
+
+    Returns
+    ----------
+    tuple
+        A (index, latitudes, longitudes) triple, where index maps ICAO
+        codes to positions in the two coordinate arrays.
+    """
+    positions = load_airports_positions()
+    index = {icao_code: i for i, icao_code in enumerate(positions)}
+    count = len(positions)
+    latitudes = np.fromiter(
+        (position[0] for position in positions.values()), dtype=np.float64, count=count
+    )
+    longitudes = np.fromiter(
+        (position[1] for position in positions.values()), dtype=np.float64, count=count
+    )
+    return index, latitudes, longitudes
+
+
+def airport_index(icao_code: str) -> int:
+    """Gets the row index of an airport in the coordinate arrays.
+
+    Parameters
+    ----------
+    icao_code : str
+        The ICAO code of the airport.
+
+    Returns
+    ----------
+    int
+        The index of the airport in the latitude and longitude arrays.
+    """
+    return load_airports_table()[0][icao_code]
+
+
+@lru_cache(maxsize=1)
+def load_airports_radians() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Precomputes the radian coordinates of all airports, along with the
+        cosine of their latitudes, so repeated distance computations skip
+        the degrees-to-radians conversion and one trig call per airport.
+        The arrays are kept in float32: the batched haversine halves its
+        memory traffic and fits twice as many lanes per SIMD register,
+        while the sub-kilometer precision loss is irrelevant for demand
+        estimation. Per-airport scalar lookups still use the float64
+        arrays of load_airports_table.
+
+    Returns
+    ----------
+    tuple
+        A (phi, lam, cos_phi) triple of float32 arrays, aligned with the
+        indices of load_airports_table.
+    """
+    _, latitudes, longitudes = load_airports_table()
+    phi = np.radians(latitudes).astype(np.float32)
+    lam = np.radians(longitudes).astype(np.float32)
+    return phi, lam, np.cos(phi)
+
+
+def bulk_gc_distance(indices_a: np.ndarray, indices_b: np.ndarray) -> np.ndarray:
+    """Computes the great-circle distances between two arrays of airports
+        in a single vectorized pass over the precomputed radian arrays.
+
+    Parameters
+    ----------
+    indices_a : np.ndarray
+        The row indices of the first airports (see airport_index).
+    indices_b : np.ndarray
+        The row indices of the second airports.
+
+    Returns
+    ----------
+    np.ndarray
+        The great-circle distances between each pair of airports, in kilometers.
+    """
+    phi, lam, cos_phi = load_airports_radians()
+    dphi = phi[indices_b] - phi[indices_a]
+    dlam = lam[indices_b] - lam[indices_a]
+    h = (
+        np.sin(dphi / 2) ** 2
+        + cos_phi[indices_a] * cos_phi[indices_b] * np.sin(dlam / 2) ** 2
+    )
+    # clamp against rounding pushing h just above 1 for near-antipodal pairs
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+
 class Airport:
     """A class to represent an airport."""
 
@@ -65,8 +203,13 @@ class Airport:
         self.full_name, self.location, self.country, self.time_zone = (
             load_airport_data()[icao_code]
         )
-        self.latitude = self.get_latitude_and_longitude()[0]
-        self.longitude = self.get_latitude_and_longitude()[1]
+        self.latitude, self.longitude = self.get_latitude_and_longitude()
+        if self.latitude is not None:
+            self.lat_rad = radians(self.latitude)
+            self.lon_rad = radians(self.longitude)
+            self.cos_lat = cos(self.lat_rad)
+        else:
+            self.lat_rad = self.lon_rad = self.cos_lat = None
 
     def __str__(self):
         return f"Airport: {self.full_name} ({self.icao_code})"
@@ -79,7 +222,8 @@ class Airport:
         tuple
             A tuple of the latitude and longitude of the airport.
         """
-        airport_positions = load_airports_positions()
-        if self.icao_code in airport_positions:
-            return airport_positions[self.icao_code]
+        index, latitudes, longitudes = load_airports_table()
+        if self.icao_code in index:
+            i = index[self.icao_code]
+            return latitudes[i], longitudes[i]
         return None, None
@@ -1,9 +1,37 @@
 """Module to handle database operations.
 """
 
+from mmap import ACCESS_READ, mmap
+from os.path import getsize
+
 from mysql import connector
 
 
+INSERT_BATCH_SIZE = 10_000
+
+
+def _coerce(value: str):
+    """Converts a csv cell to its database representation.
+
+    Empty cells become NULL, integer-looking cells (including negative ones)
+    become ints, and everything else is kept as a string.
+
+    Parameters
+    ----------
+    value : str
+        The raw cell value from the csv file.
+
+    Returns
+    ----------
+    The coerced value: None, int or str.
+    """
+    if not value:
+        return None
+    if value.isdigit() or (value[:1] == "-" and value[1:].isdigit()):
+        return int(value)
+    return value
+
+
 class Database:
     """Class for connecting to the database and adding data to it.
 
@@ -16,10 +44,10 @@ class Database:
 
     Methods
     ----------
-    check_if_primary_key_exists(table_name: str, pk_column: str, pk_value: str) -> bool
-        Checks whether or not an entry of known primary key already exists in the table.
-    process_line(line, table_name, pk_name, expected_length) -> bool
-        Processes a line from a csv file and inserts it into the database.
+    fetch_existing_primary_keys(table_name: str, pk_column: str) -> set
+        Fetches all primary keys already present in the table.
+    process_line(line, expected_length) -> tuple
+        Parses a line from a csv file into a tuple of values.
     import_csv(file_path: str, table_name: str) -> None
         Imports data from a csv file into the database.
     add_destinations(destinations_csv: str) -> None
@@ -35,77 +63,63 @@ class Database:
 
     def __init__(self):
         self.db = connector.connect(
-            host="localhost", user="root", password="root", database="AirlineDB"
+            host="localhost",
+            user="root",
+            password="root",
+            database="AirlineDB",
+            autocommit=False,
         )
+        # a plain cursor is required for the batched inserts: the prepared
+        # cursor's executemany falls back to one execution per row instead
+        # of rewriting the batch into a multi-row INSERT
         self.cursor = self.db.cursor()
 
-    def check_if_primary_key_exists(
-        self, table_name: str, pk_column: str, pk_value: str
-    ) -> bool:
-        """Checks whether or not an entry of known primary key already exists in the table.
+    def fetch_existing_primary_keys(self, table_name: str, pk_column: str) -> set:
+        """Fetches all primary keys already present in the table in a single query.
 
         Parameters
         ----------
         table_name : str
-            The name of the table to check the primary key in.
+            The name of the table to fetch the primary keys from.
         pk_column : str
             The name of the primary key column.
-        pk_value : str
-            The value of the primary key to check.
 
         Returns
         -------
-        bool
-            True if the PK exists, False otherwise.
+        set
+            The set of all primary key values already in the table.
         """
-        check_query = (
-            f"SELECT EXISTS(SELECT 1 FROM {table_name} WHERE {pk_column} = %s)"
-        )
-        self.cursor.execute(check_query, (pk_value,))
-        return self.cursor.fetchone()[0] == 1
+        self.cursor.execute(f"SELECT {pk_column} FROM {table_name}")
+        return {row[0] for row in self.cursor.fetchall()}
 
-    def process_line(self, line, table_name, pk_name, expected_length) -> bool:
-        """Processes a line from a csv file and inserts it into the database.
+    def process_line(self, line, expected_length) -> tuple:
+        """Parses a line from a csv file into a tuple of values ready for insertion.
 
         Parameters
         ----------
         line : str
             The line from the csv file to process.
-        table_name : str
-            The name of the table to insert the data into.
-        pk_name : str
-            The name of the primary key column.
         expected_length : int
             The expected number of values in the line.
 
         Returns
         ----------
-        bool
-            True if data was added, False otherwise.
+        tuple
+            The parsed values, or None if the line is malformed.
         """
         line = line.strip()
         values = line.split(",")
-        if len(values) == expected_length:
-            try:
-                # account for NULL entries and convert to int if possible
-                values = [
-                    None if value == "" else (int(value) if value.isdigit() else value)
-                    for value in values
-                ]
-                placeholders = ",".join(["%s"] * len(values))
-                query = f"INSERT INTO {table_name} VALUES ({placeholders})"
-                if not self.check_if_primary_key_exists(table_name, pk_name, values[0]):
-                    self.cursor.execute(query, tuple(values))
-                    return True
-                print(f"Skipping line {line}, due to duplicate primary key")
-            except ValueError as e:
-                print(f"Error inserting {line}: {e}")
-        else:
+        if len(values) != expected_length:
             print(f"Skipping line: {line}, due to incorrect number of values")
-        return False
+            return None
+        return tuple(map(_coerce, values))
 
     def import_csv(self, file_path: str, table_name: str) -> None:
-        """Imports data from a csv file into the database
+        """Imports data from a csv file into the database.
+
+        Existing primary keys are fetched once up front so duplicates are
+        filtered in-memory, and the surviving rows are inserted in large
+        batches within a single transaction instead of one round trip per row.
 
         Parameters
         ----------
@@ -114,18 +128,36 @@ class Database:
         table_name : str
             The name of the table to insert the data into.
         """
-        with open(file_path, "r", encoding="utf-8") as file:
-            header = file.readline().split(",")
+        if not getsize(file_path):
+            # mmap refuses zero-length files, and there is nothing to import
+            print(f"Nothing to change in {table_name}.")
+            return
+        rows = []
+        with open(file_path, "rb") as file, mmap(
+            file.fileno(), 0, access=ACCESS_READ
+        ) as mapped:
+            header = mapped.readline().decode("utf-8").strip().split(",")
             pk_name = header[0]
             expected_length = len(header)
-            data_added = False
-            for line in file:
-                data_added = (
-                    self.process_line(line, table_name, pk_name, expected_length)
-                    or data_added
-                )
+            existing = self.fetch_existing_primary_keys(table_name, pk_name)
+            for raw_line in iter(mapped.readline, b""):
+                line = raw_line.decode("utf-8")
+                if not line.strip():
+                    continue
+                values = self.process_line(line, expected_length)
+                if values is None:
+                    continue
+                if values[0] in existing:
+                    print(f"Skipping line {line.strip()}, due to duplicate primary key")
+                    continue
+                existing.add(values[0])
+                rows.append(values)
+        placeholders = ",".join(["%s"] * expected_length)
+        query = f"INSERT INTO {table_name} VALUES ({placeholders})"
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            self.cursor.executemany(query, rows[start : start + INSERT_BATCH_SIZE])
         self.db.commit()
-        if data_added:
+        if rows:
             print(f"Data added to {table_name}.")
         else:
             print(f"Nothing to change in {table_name}.")
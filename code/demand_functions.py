@@ -4,8 +4,11 @@
 """
 
 from datetime import date
-from numpy import exp, log, sqrt
-from scipy.stats import lognorm
+from functools import lru_cache
+
+from math import exp, log, pi, sqrt
+
+import numpy as np
 
 
 WEIGHT_EF: float = 0.4
@@ -17,12 +20,43 @@ PEAK_SEASON_MULTIPLIER: float = 1.5
 STD_SEASON_MULTIPLIER: float = 1.0
 OFF_PEAK_SEASON_MULTIPLIER: float = 0.5
 
+# month-indexed seasonality table (index 0 is unused); peak months are the
+# summer holidays and December, off-peak are January and February
+SEASONALITY_BY_MONTH: tuple[float, ...] = (
+    0.0,
+    OFF_PEAK_SEASON_MULTIPLIER,
+    OFF_PEAK_SEASON_MULTIPLIER,
+    STD_SEASON_MULTIPLIER,
+    STD_SEASON_MULTIPLIER,
+    STD_SEASON_MULTIPLIER,
+    PEAK_SEASON_MULTIPLIER,
+    PEAK_SEASON_MULTIPLIER,
+    PEAK_SEASON_MULTIPLIER,
+    STD_SEASON_MULTIPLIER,
+    STD_SEASON_MULTIPLIER,
+    STD_SEASON_MULTIPLIER,
+    PEAK_SEASON_MULTIPLIER,
+)
+
 DEMAND_SCALING_FACTOR: int = 10_000
 
+FIRST_CLASS_FACTOR: float = 0.05
+BUSINESS_CLASS_ECONOMIC_FACTOR: float = 0.08
+BUSINESS_CLASS_TOURISM_FACTOR: float = 0.07
+ECONOMY_CLASS_FACTOR: float = 0.8
+
+DISTANCE_FACTOR_SCALE: int = 1000
+DISTANCE_FACTOR_SIGMA: float = 0.5
+LN_DISTANCE_FACTOR_SCALE: float = log(DISTANCE_FACTOR_SCALE)
+DISTANCE_PDF_NORM: float = 1 / (DISTANCE_FACTOR_SIGMA * sqrt(2 * pi))
+# the peak of the lognormal PDF is a constant, so compute it only once
+MAX_DISTANCE_PDF: float = DISTANCE_PDF_NORM / DISTANCE_FACTOR_SCALE
+
 
 # --------------------------------------------------------------------- #
 #                       BASE DEMAND CALCULATION                         #
 # --------------------------------------------------------------------- #
+@lru_cache(maxsize=4096)
 def __compute_population_factor(
     populations: tuple[int, int], product_of_populations: int
 ) -> float:
@@ -49,6 +83,7 @@ def __compute_population_factor(
     return sqrt(product_of_populations) / max(populations)
 
 
+@lru_cache(maxsize=4096)
 def __compute_economic_factor(
     gdps: tuple[float, float], plis: tuple[float, float]
 ) -> float:
@@ -76,9 +111,11 @@ def __compute_economic_factor(
     adjusted_gdppc_origin = gdps[0] / plis[0]
     adjusted_gdppc_dest = gdps[-1] / plis[-1]
     esr = adjusted_gdppc_origin / adjusted_gdppc_dest
-    return 1 / (1 + exp(-log(esr + 1e-5)))
+    # sigmoid(log(x)) == x / (1 + x), so the exp/log round-trip cancels out
+    return (esr + 1e-5) / (1 + esr + 1e-5)
 
 
+@lru_cache(maxsize=4096)
 def __compute_tourism_factor(
     tourism_expenditures: tuple[float, float], product_of_expenditures: float
 ) -> float:
@@ -122,11 +159,16 @@ def __compute_distance_factor(distance: float) -> float:
     float
         The distance factor DF, where 0 <= DF <= 1.
     """
-    scale = 1000
-    sigma = 0.5
-    pdf_value = lognorm.pdf(distance, sigma, scale=scale)
-    max_pdf = lognorm.pdf(scale, sigma, scale=scale)
-    return min(pdf_value / max_pdf, 1.0)
+    # the lognormal PDF is 0 outside its support; zero distances do occur
+    # (placeholder 0/0 coordinates in the airport database make identical
+    # coordinates, hence a distance of exactly 0)
+    if distance <= 0:
+        return 0.0
+    ln_ratio = log(distance) - LN_DISTANCE_FACTOR_SCALE
+    pdf_value = (DISTANCE_PDF_NORM / distance) * exp(
+        -(ln_ratio * ln_ratio) / (2 * DISTANCE_FACTOR_SIGMA * DISTANCE_FACTOR_SIGMA)
+    )
+    return min(pdf_value / MAX_DISTANCE_PDF, 1.0)
 
 
 def _get_seasonality_factor(curr_date: date) -> float:
@@ -147,14 +189,7 @@ def _get_seasonality_factor(curr_date: date) -> float:
     float
         The seasonality factor SF, where 0.5 <= SF <= 1.5.
     """
-    curr_month = curr_date.month
-    match curr_month:
-        case 6 | 7 | 8 | 12:
-            return PEAK_SEASON_MULTIPLIER
-        case 1 | 2:
-            return OFF_PEAK_SEASON_MULTIPLIER
-        case _:
-            return STD_SEASON_MULTIPLIER
+    return SEASONALITY_BY_MONTH[curr_date.month]
 
 
 def __compute_composite_score(distance, **kwargs) -> float:
@@ -190,6 +225,141 @@ def _compute_base_demand(distance, **kwargs) -> float:
     return __compute_composite_score(distance, **kwargs) * DEMAND_SCALING_FACTOR
 
 
+def __compute_factors_batch(
+    distances: np.ndarray,
+    populations: np.ndarray,
+    gdps: np.ndarray,
+    plis: np.ndarray,
+    tourism_expenditures: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the population, economic, tourism and distance factors for
+        a whole batch of routes as array operations, so N routes cost a
+        handful of vectorized calls instead of N trips through the scalar
+        factor functions.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        The distances of the N routes.
+    populations : np.ndarray
+        An (N, 2) array of origin and destination city populations.
+    gdps : np.ndarray
+        An (N, 2) array of origin and destination country GDPs.
+    plis : np.ndarray
+        An (N, 2) array of origin and destination country PLIs.
+    tourism_expenditures : np.ndarray
+        An (N, 2) array of origin and destination tourism expenditures.
+
+    Returns
+    ----------
+    tuple
+        A (PF, EF, TF, DF) tuple of length-N factor arrays.
+    """
+    # single precision is plenty for demand estimates and doubles the
+    # SIMD lane count of the transcendental calls below
+    distances = np.asarray(distances, dtype=np.float32)
+    if distances.size == 0:
+        # an empty batch has no (N, 2) structure to index into below
+        empty = np.empty(0, dtype=np.float32)
+        return empty, empty, empty, empty
+    populations = np.asarray(populations, dtype=np.float32)
+    gdps = np.asarray(gdps, dtype=np.float32)
+    plis = np.asarray(plis, dtype=np.float32)
+    tourism_expenditures = np.asarray(tourism_expenditures, dtype=np.float32)
+    pf = np.sqrt(populations[:, 0] * populations[:, 1]) / populations.max(axis=1)
+    esr = (gdps[:, 0] / plis[:, 0]) / (gdps[:, 1] / plis[:, 1])
+    ef = (esr + 1e-5) / (1 + esr + 1e-5)
+    tf = np.sqrt(
+        tourism_expenditures[:, 0] * tourism_expenditures[:, 1]
+    ) / tourism_expenditures.max(axis=1)
+    # zero distances sit outside the lognormal support, where the PDF is 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ln_ratios = np.log(distances) - LN_DISTANCE_FACTOR_SCALE
+        pdf_values = (DISTANCE_PDF_NORM / distances) * np.exp(
+            -(ln_ratios * ln_ratios)
+            / (2 * DISTANCE_FACTOR_SIGMA * DISTANCE_FACTOR_SIGMA)
+        )
+        df = np.where(
+            distances > 0, np.minimum(pdf_values / MAX_DISTANCE_PDF, 1.0), 0.0
+        )
+    return pf, ef, tf, df
+
+
+def _compute_base_demand_batch(
+    distances: np.ndarray,
+    populations: np.ndarray,
+    gdps: np.ndarray,
+    plis: np.ndarray,
+    tourism_expenditures: np.ndarray,
+) -> np.ndarray:
+    """Computes the base demand for a whole batch of routes in one pass.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        The distances of the N routes.
+    populations : np.ndarray
+        An (N, 2) array of origin and destination city populations.
+    gdps : np.ndarray
+        An (N, 2) array of origin and destination country GDPs.
+    plis : np.ndarray
+        An (N, 2) array of origin and destination country PLIs.
+    tourism_expenditures : np.ndarray
+        An (N, 2) array of origin and destination tourism expenditures.
+
+    Returns
+    ----------
+    np.ndarray
+        The base demand of each route, each between 0 and DEMAND_SCALING_FACTOR.
+    """
+    pf, ef, tf, df = __compute_factors_batch(
+        distances, populations, gdps, plis, tourism_expenditures
+    )
+    composite = WEIGHT_PF * pf + WEIGHT_EF * ef + WEIGHT_TF * tf + WEIGHT_DF * df
+    return composite * DEMAND_SCALING_FACTOR
+
+
+def _compute_route_demand_batch(
+    distances: np.ndarray,
+    populations: np.ndarray,
+    gdps: np.ndarray,
+    plis: np.ndarray,
+    tourism_expenditures: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the base demand and all three class multipliers for a whole
+        batch of routes in one vectorized pass, the array counterpart of
+        _compute_route_demand.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        The distances of the N routes.
+    populations : np.ndarray
+        An (N, 2) array of origin and destination city populations.
+    gdps : np.ndarray
+        An (N, 2) array of origin and destination country GDPs.
+    plis : np.ndarray
+        An (N, 2) array of origin and destination country PLIs.
+    tourism_expenditures : np.ndarray
+        An (N, 2) array of origin and destination tourism expenditures.
+
+    Returns
+    ----------
+    tuple
+        The base demands followed by the first, business and economy
+        class multiplier arrays.
+    """
+    pf, ef, tf, df = __compute_factors_batch(
+        distances, populations, gdps, plis, tourism_expenditures
+    )
+    composite = WEIGHT_PF * pf + WEIGHT_EF * ef + WEIGHT_TF * tf + WEIGHT_DF * df
+    base_demands = composite * DEMAND_SCALING_FACTOR
+    fcm = ef * FIRST_CLASS_FACTOR
+    bcm = ef * BUSINESS_CLASS_ECONOMIC_FACTOR + tf * BUSINESS_CLASS_TOURISM_FACTOR
+    ecm = (pf + df) * ECONOMY_CLASS_FACTOR
+    return base_demands, fcm, bcm, ecm
+
+
 # --------------------------------------------------------------------- #
 #                   CLASS-SPECIFIC DEMAND MULTIPLIERS                   #
 # --------------------------------------------------------------------- #
@@ -212,7 +382,7 @@ def _get_first_class_multiplier(gdps: tuple[float, float], plis: tuple[float, fl
     float
         The first class multiplier, where 0 <= FCM <= 0.05.
     """
-    return __compute_economic_factor(gdps, plis) * 0.05
+    return __compute_economic_factor(gdps, plis) * FIRST_CLASS_FACTOR
 
 
 def _get_business_class_multiplier(
@@ -244,8 +414,9 @@ def _get_business_class_multiplier(
         The business class multiplier, where 0 <= BCM <= 0.15.
     """
     return (
-        __compute_economic_factor(gdps, plis) * 0.08
-        + __compute_tourism_factor(tourism_expenditures, product_of_expenditures) * 0.07
+        __compute_economic_factor(gdps, plis) * BUSINESS_CLASS_ECONOMIC_FACTOR
+        + __compute_tourism_factor(tourism_expenditures, product_of_expenditures)
+        * BUSINESS_CLASS_TOURISM_FACTOR
     )
 
 
@@ -275,4 +446,37 @@ def _get_economy_class_multiplier(
     return (
         __compute_population_factor(populations, product_of_populations)
         + __compute_distance_factor(distance)
-    ) * 0.8
+    ) * ECONOMY_CLASS_FACTOR
+
+
+def _compute_route_demand(distance: float, **kwargs) -> tuple[float, float, float, float]:
+    """Computes the base demand and all three class multipliers in a single
+        pass, evaluating each underlying factor exactly once instead of
+        re-entering the factor functions per multiplier.
+
+    Parameters
+    ----------
+    distance : float
+        The distance between the origin and destination cities
+
+    Returns
+    ----------
+    tuple[float, float, float, float]
+        The base demand followed by the first, business and economy
+        class multipliers.
+    """
+    populations = kwargs.get("populations")
+    gdps = kwargs.get("gdps")
+    plis = kwargs.get("plis")
+    tourism_expenditures = kwargs.get("tourism_expenditures")
+    pf = __compute_population_factor(populations[:2], populations[3])
+    ef = __compute_economic_factor(gdps[:2], plis[:2])
+    tf = __compute_tourism_factor(tourism_expenditures[:2], tourism_expenditures[3])
+    df = __compute_distance_factor(distance)
+    base_demand = (
+        WEIGHT_PF * pf + WEIGHT_EF * ef + WEIGHT_TF * tf + WEIGHT_DF * df
+    ) * DEMAND_SCALING_FACTOR
+    fcm = ef * FIRST_CLASS_FACTOR
+    bcm = ef * BUSINESS_CLASS_ECONOMIC_FACTOR + tf * BUSINESS_CLASS_TOURISM_FACTOR
+    ecm = (pf + df) * ECONOMY_CLASS_FACTOR
+    return base_demand, fcm, bcm, ecm
@@ -1,19 +1,48 @@
 """Helper functions for the project.
 """
 
+import shelve
 from functools import lru_cache, wraps
+from math import asin, cos, radians, sin, sqrt
 from pathlib import Path
+from threading import Lock
 from time import perf_counter
 from logging import basicConfig, INFO, info
 from typing import Union
 
 import numpy as np
-from requests import RequestException, get
+from requests import RequestException, Session
+from requests.adapters import HTTPAdapter, Retry
 
 
 basicConfig(level=INFO)
 
 
+_SESSION = Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+        ),
+    ),
+)
+
+
+EARTH_RADIUS_KM = 6378.1
+
+# the shelve backends neither create a missing parent directory nor support
+# concurrent access, so the directory is made here and every shelve file in
+# the project is guarded by a module-level lock
+CACHES_DIR = Path("caches")
+CACHES_DIR.mkdir(exist_ok=True)
+
+GEONAMES_CACHE = "caches/geonames_cache"
+_GEONAMES_LOCK = Lock()
+
+
 def timer(func):
     """Decorator to measure the execution time of a function."""
 
@@ -48,8 +77,11 @@ def normalise(value: float, _min: float, _max: float) -> float:
     return (value - _min) / (_max - _min)
 
 
+@lru_cache()
 def get_min_and_max_distances(routes_csv: Path) -> tuple:
     """Finds the shortest and longest routes in the csv file.
+        The result is cached per file path, so repeated evaluations do not
+        re-read the csv.
 
     Parameters
     ----------
@@ -61,18 +93,8 @@ def get_min_and_max_distances(routes_csv: Path) -> tuple:
     tuple[float, float]
         The minimum and maximum distances.
     """
-    min_distance = np.inf
-    max_distance = -np.inf
-    with open(routes_csv, "r", encoding="utf-8") as infile:
-        next(infile)
-        for line in infile:
-            line = line.strip()
-            if line:
-                _, _, distance = line.split(",")
-                distance = float(distance)
-                min_distance = min(min_distance, distance)
-                max_distance = max(max_distance, distance)
-    return min_distance, max_distance
+    distances = np.loadtxt(routes_csv, delimiter=",", skiprows=1, usecols=2)
+    return float(distances.min()), float(distances.max())
 
 
 def degrees_to_radians(degrees: float) -> float:
@@ -88,7 +110,66 @@ def degrees_to_radians(degrees: float) -> float:
     float
         The angle in radians.
     """
-    return degrees * np.pi / 180
+    return radians(degrees)
+
+
+def _gc_distance_scalar(
+    phi1: float, lambda1: float, phi2: float, lambda2: float
+) -> float:
+    """Scalar haversine kernel operating on plain floats. It deliberately
+        uses the math module instead of NumPy, as ufunc dispatch overhead
+        dwarfs the arithmetic when computing one distance at a time.
+
+    Parameters
+    ----------
+    phi1, lambda1 : float
+        The latitude and longitude of the first airport, in radians.
+    phi2, lambda2 : float
+        The latitude and longitude of the second airport, in radians.
+
+    Returns
+    ----------
+    float
+        The great-circle distance between the two airports in kilometers.
+    """
+    return gc_distance_with_cos(phi1, lambda1, cos(phi1), phi2, lambda2, cos(phi2))
+
+
+def gc_distance_with_cos(
+    phi1: float,
+    lambda1: float,
+    cos_phi1: float,
+    phi2: float,
+    lambda2: float,
+    cos_phi2: float,
+) -> float:
+    """Haversine variant for callers that already hold the cosine of each
+        latitude (Airport caches it at construction), saving two trig calls
+        per distance on top of the scalar kernel.
+
+    Parameters
+    ----------
+    phi1, lambda1, cos_phi1 : float
+        The latitude, longitude (radians) and cos(latitude) of the
+        first airport.
+    phi2, lambda2, cos_phi2 : float
+        The latitude, longitude (radians) and cos(latitude) of the
+        second airport.
+
+    Returns
+    ----------
+    float
+        The great-circle distance between the two airports in kilometers.
+    """
+    if phi1 == phi2 and lambda1 == lambda2:
+        return 0.0
+    h = (
+        sin((phi2 - phi1) / 2) ** 2
+        + cos_phi1 * cos_phi2 * sin((lambda2 - lambda1) / 2) ** 2
+    )
+    # rounding can push h just above 1 for near-antipodal points, which
+    # would take the square root outside the domain of asin
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(min(h, 1.0)))
 
 
 def gc_distance(airport_coords1: tuple, airport_coords2: tuple) -> float:
@@ -114,39 +195,16 @@ def gc_distance(airport_coords1: tuple, airport_coords2: tuple) -> float:
     https://community.esri.com/t5/coordinate-reference-systems-blog/distance-on-a-sphere-the-haversine-formula/ba-p/902128#:~:text=All%20of%20these%20can%20be,longitude%20of%20the%20two%20points
     """
 
-    def haversin(alpha: float) -> float:
-        """Computes the haversine function of an angle in radians.
-
-        Parameters
-        ----------
-        alpha : float
-            The angle in radians.
-
-        Returns
-        ----------
-        float
-            The haversine function of the angle.
-        """
-        return np.sin(alpha / 2) ** 2
-
-    earth_radius_km = 6378.1
     (phi1, lambda1), (phi2, lambda2) = airport_coords1, airport_coords2
-    return (
-        2
-        * earth_radius_km
-        * np.arcsin(
-            np.sqrt(
-                haversin(phi2 - phi1)
-                + np.cos(phi1) * np.cos(phi2) * haversin(lambda2 - lambda1)
-            )
-        )
-    )
+    return _gc_distance_scalar(phi1, lambda1, phi2, lambda2)
 
 
 @lru_cache()
 def get_city_population_geonames(city_name: str, username: str) -> Union[int, None]:
     """
     Fetches the population of a specified city using the GeoNames API.
+    Successful lookups are persisted in a local shelve cache, so reruns
+    skip the network entirely for cities already seen.
 
     Parameters
     -----------
@@ -160,6 +218,10 @@ def get_city_population_geonames(city_name: str, username: str) -> Union[int, No
     int
         The population of the city, or None if no data was found.
     """
+    with _GEONAMES_LOCK:
+        with shelve.open(GEONAMES_CACHE) as db:
+            if city_name in db:
+                return db[city_name]
     base_url = "http://api.geonames.org/searchJSON"
     params = {
         "q": city_name,
@@ -169,11 +231,15 @@ def get_city_population_geonames(city_name: str, username: str) -> Union[int, No
         "cities": "cities1000",  # Limits search to cities with a population > 1000
     }
     try:
-        response = get(base_url, params=params, timeout=10)
+        response = _SESSION.get(base_url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         if data["totalResultsCount"] > 0:
-            return data["geonames"][0].get("population")
+            population = data["geonames"][0].get("population")
+            with _GEONAMES_LOCK:
+                with shelve.open(GEONAMES_CACHE) as db:
+                    db[city_name] = population
+            return population
         print(f"No data found for {city_name}.")
         return None
     except RequestException as e:
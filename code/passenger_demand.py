@@ -1,34 +1,116 @@
 """Module that handles passenger demand computations
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 
 from code.worldbank import WorldBank
 from code.helpers import get_city_population_geonames
 from code.demand_functions import (
-    _compute_base_demand,
+    _compute_route_demand,
     _get_seasonality_factor,
-    _get_first_class_multiplier,
-    _get_business_class_multiplier,
-    _get_economy_class_multiplier,
 )
 
 
+@lru_cache(maxsize=None)
+def _get_world_bank(country: str) -> WorldBank:
+    """Returns a cached WorldBank instance for the given country, so routes
+        sharing a country (the hub country repeats on every row) reuse one.
+
+    Parameters
+    ----------
+    country : str
+        The name of the country.
+
+    Returns
+    ----------
+    WorldBank
+        The cached WorldBank instance.
+    """
+    return WorldBank(country)
+
+
+@lru_cache(maxsize=None)
+def _get_gdp(country: str) -> float:
+    """Gets the (memoized) GDP per capita of a country.
+
+    Parameters
+    ----------
+    country : str
+        The name of the country.
+
+    Returns
+    ----------
+    float
+        The GDP per capita of the country.
+    """
+    return _get_world_bank(country).get_gdp()
+
+
+@lru_cache(maxsize=None)
+def _get_pli(country: str) -> float:
+    """Gets the (memoized) Price Level Index of a country.
+
+    Parameters
+    ----------
+    country : str
+        The name of the country.
+
+    Returns
+    ----------
+    float
+        The Price Level Index of the country.
+    """
+    return _get_world_bank(country).get_pli()
+
+
+@lru_cache(maxsize=None)
+def _get_tourism_expenditure(country: str) -> float:
+    """Gets the (memoized) tourism expenditure of a country.
+
+    Parameters
+    ----------
+    country : str
+        The name of the country.
+
+    Returns
+    ----------
+    float
+        The tourism expenditure of the country.
+    """
+    return _get_world_bank(country).get_tourism_expenditure()
+
+
 class PassengerDemand:
     """Class to compute passenger demand for a given route."""
 
     def __init__(self, route):
         self.origin = route.hub_airport
         self.destination = route.dest_airport
-        self.distance = route.get_distance()
-        self.origin_wb = WorldBank(self.origin.country)
-        self.destination_wb = WorldBank(self.destination.country)
-        self.stats = {
-            "populations": self.get_populations(),
-            "gdps": self.get_gdps(),
-            "plis": self.get_plis(),
-            "tourism_expenditures": self.get_tourism_expenditures(),
-        }
+        self.distance = route.distance
+        self.origin_wb = _get_world_bank(self.origin.country)
+        self.destination_wb = _get_world_bank(self.destination.country)
+        # the four stat groups are independent network fetches, so overlap
+        # their latencies instead of paying for them sequentially
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            populations = executor.submit(self.get_populations)
+            gdps = executor.submit(self.get_gdps)
+            plis = executor.submit(self.get_plis)
+            tourism_expenditures = executor.submit(self.get_tourism_expenditures)
+            self.stats = {
+                "populations": populations.result(),
+                "gdps": gdps.result(),
+                "plis": plis.result(),
+                "tourism_expenditures": tourism_expenditures.result(),
+            }
+        # evaluate every demand factor exactly once for this route
+        (
+            self._base_demand,
+            self._first_class_multiplier,
+            self._business_class_multiplier,
+            self._economy_class_multiplier,
+        ) = _compute_route_demand(self.distance, **self.stats)
 
     # --------------------------------------------------------------------- #
     #                      DATA COLLECTION METHODS                          #
@@ -54,8 +136,8 @@ class PassengerDemand:
         tuple[float, float, float, float]
             Both GDPs, plus their sum and product
         """
-        gdp_i = self.origin_wb.get_gdp()
-        gdp_j = self.destination_wb.get_gdp()
+        gdp_i = _get_gdp(self.origin.country)
+        gdp_j = _get_gdp(self.destination.country)
         return (gdp_i, gdp_j, gdp_i + gdp_j, gdp_i * gdp_j)
 
     def get_plis(self) -> tuple[float, float, float, float]:
@@ -66,8 +148,8 @@ class PassengerDemand:
         tuple[float, float, float, float]
             Both PLIs, plus their sum and product
         """
-        pli_i = self.origin_wb.get_pli()
-        pli_j = self.destination_wb.get_pli()
+        pli_i = _get_pli(self.origin.country)
+        pli_j = _get_pli(self.destination.country)
         return (pli_i, pli_j, pli_i + pli_j, pli_i * pli_j)
 
     def get_tourism_expenditures(self) -> tuple[float, float, float, float]:
@@ -78,8 +160,8 @@ class PassengerDemand:
         tuple[float, float, float, float]
             Both tourism expenditures, plus their sum and product
         """
-        te_i = self.origin_wb.get_tourism_expenditure()
-        te_j = self.destination_wb.get_tourism_expenditure()
+        te_i = _get_tourism_expenditure(self.origin.country)
+        te_j = _get_tourism_expenditure(self.destination.country)
         return (te_i, te_j, te_i + te_j, te_i * te_j)
 
     # --------------------------------------------------------------------- #
@@ -93,7 +175,7 @@ class PassengerDemand:
         float
             The base demand BD as a float value between 0 and 1.
         """
-        return _compute_base_demand(self.distance, **self.stats)
+        return self._base_demand
 
     def get_seasonality_factor(self) -> float:
         """Get the seasonality factor for the route
@@ -105,17 +187,29 @@ class PassengerDemand:
         """
         return _get_seasonality_factor(date.today())
 
+    def get_multipliers(self) -> tuple[float, float, float]:
+        """Get all three class multipliers for the route in one call
+
+        Returns
+        ----------
+        tuple[float, float, float]
+            The first, business and economy class multipliers.
+        """
+        return (
+            self._first_class_multiplier,
+            self._business_class_multiplier,
+            self._economy_class_multiplier,
+        )
+
     def get_first_class_multiplier(self) -> float:
         """Get the first class multiplier for the route
 
         Returns
         ----------
         float
-            The first class multiplier FCM as a float value between 0 and 0.02.
+            The first class multiplier FCM as a float value between 0 and 0.05.
         """
-        return _get_first_class_multiplier(
-            self.stats["gdps"][0:1], self.stats["plis"][0:1]
-        )
+        return self._first_class_multiplier
 
     def get_business_class_multiplier(self) -> float:
         """Get the business class multiplier for the route
@@ -123,14 +217,9 @@ class PassengerDemand:
         Returns
         ----------
         float
-            The business class multiplier BCM as a float value between 0 and 0.08.
+            The business class multiplier BCM as a float value between 0 and 0.15.
         """
-        return _get_business_class_multiplier(
-            self.stats["gdps"][0:1],
-            self.stats["plis"][0:1],
-            self.stats["tourism_expenditures"][0:1],
-            self.stats["tourism_expenditures"][3],
-        )
+        return self._business_class_multiplier
 
     def get_economy_class_multiplier(self) -> float:
         """Get the economy class multiplier for the route
@@ -140,6 +229,4 @@ class PassengerDemand:
         float
             The economy class multiplier ECM as a float value between 0 and 0.8.
         """
-        return _get_economy_class_multiplier(
-            self.stats["populations"][0:1], self.stats["populations"][3], self.distance
-        )
+        return self._economy_class_multiplier
@@ -1,21 +1,73 @@
 """Module to represent a route between two airports.
 """
 
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from csv import reader, writer
+from functools import cached_property, lru_cache
 from logging import info, basicConfig, INFO
 from pathlib import Path
 from shutil import move
 
-from code.airport import Airport
+import numpy as np
+
+from code.airport import Airport, airport_index, bulk_gc_distance
 from code.passenger_demand import PassengerDemand
-from code.helpers import degrees_to_radians, gc_distance, timer
+from code.helpers import gc_distance_with_cos, timer
 
 
 MAIN_HUB = "LSGG"
 
+CSV_BUFFER_SIZE = 1 << 20
+MAX_ROUTE_WORKERS = 32
+
 basicConfig(level=INFO)
 
 
+@lru_cache(maxsize=None)
+def _get_airport(icao_code: str) -> Airport:
+    """Returns a cached Airport instance for the given ICAO code, so routes
+        sharing an endpoint (every route shares the hub) reuse one object.
+
+    Parameters
+    ----------
+    icao_code : str
+        The ICAO code of the airport.
+
+    Returns
+    ----------
+    Airport
+        The cached airport instance.
+    """
+    return Airport(icao_code)
+
+
+def distances_from_hub(hub_icao: str, dest_icaos: list[str]) -> np.ndarray:
+    """Computes the distances from one hub to many destinations in a single
+        vectorized pass over the airport coordinate arrays, instead of one
+        scalar gc_distance call per destination.
+
+    Parameters
+    ----------
+    hub_icao : str
+        The ICAO code of the hub airport.
+    dest_icaos : list[str]
+        The ICAO codes of the destination airports.
+
+    Returns
+    ----------
+    np.ndarray
+        The great-circle distances from the hub to each destination,
+        in kilometers.
+    """
+    dest_indices = np.fromiter(
+        (airport_index(icao) for icao in dest_icaos),
+        dtype=np.intp,
+        count=len(dest_icaos),
+    )
+    hub_indices = np.full(len(dest_icaos), airport_index(hub_icao), dtype=np.intp)
+    return bulk_gc_distance(hub_indices, dest_indices)
+
+
 @timer
 def populate_demands_in_csv(routes_csv: Path) -> None:
     """Populates the passenger demands of each route in the csv file.
@@ -26,20 +78,36 @@ def populate_demands_in_csv(routes_csv: Path) -> None:
         The file path of the csv file containing the routes.
     """
     temp_file = routes_csv.with_suffix(".tmp")
-    with open(routes_csv, "r", encoding="utf-8") as infile, open(
-        temp_file, "w", encoding="utf-8"
+    with open(
+        routes_csv, "r", encoding="utf-8", buffering=CSV_BUFFER_SIZE, newline=""
+    ) as infile:
+        routes_reader = reader(infile)
+        header = next(routes_reader)
+        in_rows = [row for row in routes_reader if row]
+    # the network-bound stat gathering runs per route but concurrently;
+    # each PassengerDemand already evaluated its demand once at
+    # construction, so the rows below just reuse those values
+    with ThreadPoolExecutor(max_workers=MAX_ROUTE_WORKERS) as executor:
+        demands = list(
+            executor.map(
+                lambda row: PassengerDemand(Route(row[0].strip(), row[1].strip())),
+                in_rows,
+            )
+        )
+    out_rows = []
+    for row, pd in zip(in_rows, demands):
+        bd = pd.get_base_demand() * pd.get_seasonality_factor()
+        fcm, bcm, ecm = pd.get_multipliers()
+        out_rows.append(row + [int(bd * fcm), int(bd * bcm), int(bd * ecm)])
+    with open(
+        temp_file, "w", encoding="utf-8", buffering=CSV_BUFFER_SIZE, newline=""
     ) as outfile:
-        header = next(infile).strip()
-        outfile.write(
-            header + ",first_class_demand,business_class_demand,economy_class_demand\n"
+        routes_writer = writer(outfile)
+        routes_writer.writerow(
+            header
+            + ["first_class_demand", "business_class_demand", "economy_class_demand"]
         )
-        for line in infile:
-            line = line.strip()
-            if line:
-                hub, dst, _ = line.split(",")
-                route = Route(hub.strip(), dst.strip())
-                fcd, bcd, ecd = route.get_approximate_pax_demand()
-                outfile.write(f"{line},{fcd},{bcd},{ecd}\n")
+        routes_writer.writerows(out_rows)
     # replace the original file with the updated temp file
     move(temp_file, routes_csv)
 
@@ -54,22 +122,31 @@ def populate_routes_in_csv(routes_csv: Path, destinations_csv: Path) -> None:
     destinations_csv : str
         The file path of the csv file containing all destinations.
     """
+    with open(
+        destinations_csv, "r", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+    ) as infile:
+        next(infile)
+        dest_icaos = [
+            icao
+            for icao in (line.split(",")[0].strip() for line in infile if line.strip())
+            if icao != MAIN_HUB
+        ]
+
+    def process_destination(dest_icao: str) -> str:
+        info(f"Processing route {MAIN_HUB} -> {dest_icao}")
+        route = Route(MAIN_HUB, dest_icao)
+        fcd, bcd, ecd = route.get_approximate_pax_demand()
+        return f"{MAIN_HUB},{dest_icao},{route.distance:.2f},{fcd},{bcd},{ecd}\n"
+
+    # each route is an independent, network-bound unit of work, so overlap
+    # them across threads; executor.map preserves the destination order
+    with ThreadPoolExecutor(max_workers=MAX_ROUTE_WORKERS) as executor:
+        lines = list(executor.map(process_destination, dest_icaos))
     with open(routes_csv, "w", encoding="utf-8") as f:
         f.write(
             "hub_id,destination_id,distance,first_class_demand,business_class_demand,economy_class_demand\n"
         )
-        with open(destinations_csv, "r", encoding="utf-8") as infile:
-            next(infile)
-            for line in infile:
-                dest_icao = line.split(",")[0].strip()
-                if dest_icao == MAIN_HUB:
-                    continue
-                info(f"Processing route {MAIN_HUB} -> {dest_icao}")
-                route = Route(MAIN_HUB, dest_icao)
-                fcd, bcd, ecd = route.get_approximate_pax_demand()
-                f.write(
-                    f"{MAIN_HUB},{dest_icao},{route.distance:.2f},{fcd},{bcd},{ecd}\n"
-                )
+        f.writelines(lines)
     info("Finished processing all routes.")
 
 
@@ -77,33 +154,29 @@ class Route:
     """A class to represent a route between two airports."""
 
     def __init__(self, hub_icao, dest_icao):
-        self.hub_airport = Airport(hub_icao)
-        self.dest_airport = Airport(dest_icao)
+        self.hub_airport = _get_airport(hub_icao)
+        self.dest_airport = _get_airport(dest_icao)
         if self.dest_airport.latitude is None or self.dest_airport.longitude is None:
             raise ValueError(f"No such airport with ICAO code {dest_icao}")
-        self.distance = self.get_distance()
 
-    @timer
-    @lru_cache()
-    def get_distance(self):
-        """Gets the flying distance of the route
+    @cached_property
+    def distance(self):
+        """The flying distance of the route, computed on first access.
 
         Returns
         ----------
         float
             The flying distance between the two airports, in kilometers.
         """
-        hub_coords = (
-            degrees_to_radians(self.hub_airport.latitude),
-            degrees_to_radians(self.hub_airport.longitude),
-        )
-        dest_coords = (
-            degrees_to_radians(self.dest_airport.latitude),
-            degrees_to_radians(self.dest_airport.longitude),
+        return gc_distance_with_cos(
+            self.hub_airport.lat_rad,
+            self.hub_airport.lon_rad,
+            self.hub_airport.cos_lat,
+            self.dest_airport.lat_rad,
+            self.dest_airport.lon_rad,
+            self.dest_airport.cos_lat,
         )
-        return gc_distance(hub_coords, dest_coords)
 
-    @timer
     def get_approximate_pax_demand(self):
         """Computes the approximate demand for first, business and economy class passengers
 
@@ -113,8 +186,6 @@ class Route:
             A 3-tuple containing the demand for first, business and economy classes.
         """
         pd = PassengerDemand(self)
-        fcd = bcd = ecd = pd.get_base_demand() * pd.get_seasonality_factor()
-        fcd *= pd.get_first_class_multiplier()
-        bcd *= pd.get_business_class_multiplier()
-        ecd *= pd.get_economy_class_multiplier()
-        return (int(fcd), int(bcd), int(ecd))
+        bd = pd.get_base_demand() * pd.get_seasonality_factor()
+        fcm, bcm, ecm = pd.get_multipliers()
+        return (int(bd * fcm), int(bd * bcm), int(bd * ecm))
@@ -1,19 +1,47 @@
 """Helper functions for the World Bank Class.
 """
 
+import shelve
+from concurrent.futures import ThreadPoolExecutor
+from csv import writer
+from functools import lru_cache
 from logging import basicConfig, INFO, info
 from code.helpers import timer
 from pathlib import Path
-from requests import get
+from threading import Lock
+from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 
 
 MAX_SOURCE_ID = 89
+MAX_FETCH_WORKERS = 20
+CSV_BUFFER_SIZE = 1 << 20
 BASE_URL = "https://api.worldbank.org/v2/"
+COUNTRY_CODES_CACHE = "caches/country_codes_cache"
+INDICATORS_CACHE = "caches/indicators_cache"
+
+# serializes access to the shelve snapshots above; the dbm backends do not
+# tolerate concurrent opens, and lru_cache does not stop several threads
+# from entering the cached functions at once on a cold cache
+_SNAPSHOT_LOCK = Lock()
 
 
 basicConfig(level=INFO)
 
 
+SESSION = Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+        ),
+    ),
+)
+
+
 def fetch_country_codes():
     """Creates a dictionary of country names and their respective codes.
 
@@ -25,7 +53,7 @@ def fetch_country_codes():
     page = 1
     while True:
         url = f"{BASE_URL}country?format=json&page={page}"
-        response = get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
         data = response.json()
         for country in data[1]:
@@ -35,6 +63,28 @@ def fetch_country_codes():
         page += 1
 
 
+@lru_cache(maxsize=1)
+def get_country_codes() -> dict:
+    """Returns the dictionary of country names and their respective codes.
+
+    The list is fetched at most once per process and persisted to a local
+    shelve cache, so subsequent runs skip the network entirely.
+
+    Returns
+    ----------
+    dict
+        A dictionary of country names and their respective codes
+    """
+    with _SNAPSHOT_LOCK:
+        with shelve.open(COUNTRY_CODES_CACHE) as db:
+            if "codes" in db:
+                return db["codes"]
+        codes = dict(fetch_country_codes())
+        with shelve.open(COUNTRY_CODES_CACHE) as db:
+            db["codes"] = codes
+    return codes
+
+
 def get_data_for_url(base_url: str, source: int, page: int) -> dict:
     """Fetches data from a given URL.
 
@@ -52,7 +102,7 @@ def get_data_for_url(base_url: str, source: int, page: int) -> dict:
     dict
         The data fetched from the URL. If an error occurs, an empty dictionary is returned.
     """
-    response = get(
+    response = SESSION.get(
         f"{base_url}indicators?source={source}&page={page}&format=json", timeout=10
     )
     if response.status_code != 200:
@@ -67,38 +117,58 @@ def get_data_for_url(base_url: str, source: int, page: int) -> dict:
 
 def fetch_all_indicators():
     """Generator that fetches all the indicators available in the World Bank API.
-    Beware, this function is quite time consuming.
+    The first page of every source is fetched concurrently to learn each
+    source's page count, then all remaining pages are fetched through the
+    same thread pool, so one slow response no longer stalls the whole crawl.
+    Beware, this function is still quite time consuming.
     Only run this once and save the data to a file !
     """
-    source = 1
-    while source <= MAX_SOURCE_ID:
-        page = 1
-        while True:
-            data = get_data_for_url(BASE_URL, source, page)
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        first_pages = executor.map(
+            lambda source: get_data_for_url(BASE_URL, source, 1),
+            range(1, MAX_SOURCE_ID + 1),
+        )
+        remaining = []
+        for source, data in enumerate(first_pages, start=1):
             if not data:
-                break
+                continue
             page_info, page_data = data
             if page_data:
                 yield page_data
-            if page_info["page"] >= page_info["pages"]:
-                break
-            page += 1
-        source += 1
+            remaining.extend(
+                (source, page) for page in range(2, page_info["pages"] + 1)
+            )
+        for data in executor.map(
+            lambda source_page: get_data_for_url(BASE_URL, *source_page), remaining
+        ):
+            if data and data[1]:
+                yield data[1]
 
 
+@lru_cache(maxsize=1)
 def generate_indicator_dict():
     """Creates a dictionary of indicator names and their respective IDs.
+        The full crawl behind this is expensive, so the dictionary is built
+        at most once per process and persisted to a local shelve cache;
+        subsequent runs load it from disk instead of the API.
 
     Returns
     ----------
     dict
         A dictionary of indicator (id, name) key-value pairs
     """
-    return {
-        idct["id"]: idct["name"]
-        for indicators in fetch_all_indicators()
-        for idct in indicators
-    }
+    with _SNAPSHOT_LOCK:
+        with shelve.open(INDICATORS_CACHE) as db:
+            if "indicators" in db:
+                return db["indicators"]
+        indicator_dict = {
+            idct["id"]: idct["name"]
+            for indicators in fetch_all_indicators()
+            for idct in indicators
+        }
+        with shelve.open(INDICATORS_CACHE) as db:
+            db["indicators"] = indicator_dict
+    return indicator_dict
 
 
 @timer
@@ -108,10 +178,13 @@ def write_indicators(path_to_csv: Path):
     Parameters:
         path_to_csv (Path): the path to the CSV file.
     """
-    with open(path_to_csv, "w", encoding="utf-8") as f:
-        f.write("source;indicator_id;indicator_name\n")
+    with open(
+        path_to_csv, "w", encoding="utf-8", buffering=CSV_BUFFER_SIZE, newline=""
+    ) as f:
+        indicators_writer = writer(f, delimiter=";")
+        indicators_writer.writerow(["source", "indicator_id", "indicator_name"])
         for indicators in fetch_all_indicators():
-            for idct in indicators:
-                f.write(
-                    f"{int(idct['source']['id'])};{idct['id'].lower()};{idct['name']}\n"
-                )
+            indicators_writer.writerows(
+                (int(idct["source"]["id"]), idct["id"].lower(), idct["name"])
+                for idct in indicators
+            )
@@ -5,19 +5,17 @@ https://api.worldbank.org/v2/country/indicator/ny.gdp.pcap.cd?date=2023&format=j
 """
 
 import shelve
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from threading import Lock
 
 from code.helpers import timer
-from code.wb_helpers import fetch_country_codes, BASE_URL
-
-from requests import get
+from code.wb_helpers import get_country_codes, BASE_URL, SESSION
 
 GDP_PER_CAPITA_USD = "ny.gdp.pcap.cd"
 PRICE_LEVEL_INDEX = "pa.nus.pppc.rf"
 TOURISM_EXPENDITURE = "st.int.xpnd.cd"
 
-COUNTRY_CODES = dict(fetch_country_codes())
-
 KNOWN_EXCEPTIONS = {
     "Czech Republic": "Czechia",
     "Turkey": "Turkiye",
@@ -25,21 +23,31 @@ KNOWN_EXCEPTIONS = {
     "South Korea": "Korea, Rep.",
 }
 
+# in-process layer on top of the shelve caches, so repeated lookups for the
+# same (country, category) pair within a run skip the shelve open entirely;
+# the lock serializes the shelve opens themselves, which the dbm backends
+# do not tolerate concurrently
+_CATEGORY_VALUES: dict[tuple[str, str], float] = {}
+_CATEGORY_LOCK = Lock()
+
 
 class WorldBank:
     """Class used for wbdata collection."""
 
+    __slots__ = ("country", "country_code")
+
     def __init__(self, country):
-        if country in COUNTRY_CODES:
+        country_codes = get_country_codes()
+        if country in country_codes:
             self.country = country
-            self.country_code = COUNTRY_CODES[country]
+            self.country_code = country_codes[country]
         else:
-            keys = list(COUNTRY_CODES.keys())
+            keys = list(country_codes.keys())
             # check if the country appears as substring of one of the keys
             for key in keys:
                 if country in key:
                     self.country = key
-                    self.country_code = COUNTRY_CODES[key]
+                    self.country_code = country_codes[key]
                     break
             else:
                 if country not in KNOWN_EXCEPTIONS:
@@ -48,7 +56,7 @@ class WorldBank:
                     )
                 wb_name = KNOWN_EXCEPTIONS[country]
                 self.country = wb_name
-                self.country_code = COUNTRY_CODES[wb_name]
+                self.country_code = country_codes[wb_name]
 
     def get_category(self, category: str) -> float:
         """Gets the data for a given category.
@@ -64,18 +72,21 @@ class WorldBank:
             The data for the given category; -1.0 if no data is found
         """
         curr_year = date.today().year
-        while True:
-            url = f"{BASE_URL}country/{self.country_code}/indicator/{category}?date={curr_year}&format=json"
-            response = get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            if data[1]:
-                value = data[1][0].get("value")
+        # a single range request returns all years at once (newest first),
+        # instead of one round-trip per year until a value is found
+        url = (
+            f"{BASE_URL}country/{self.country_code}/indicator/{category}"
+            f"?date=1960:{curr_year}&per_page=100&format=json"
+        )
+        response = SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        if len(data) > 1 and data[1]:
+            for entry in data[1]:
+                value = entry.get("value")
                 if value is not None:
                     return float(value)
-            curr_year -= 1
-            if curr_year < 1960:
-                return -1.0
+        return -1.0
 
     def get_category_with_cache(self, category: str) -> float:
         """Gets a specific cateogry with caching.
@@ -90,12 +101,41 @@ class WorldBank:
         float
             The data for the given category; -1.0 if no data is found
         """
-        with shelve.open(f"caches/{category}_cache") as db:
-            if self.country_code in db:
-                return db[self.country_code]
-            value = self.get_category(category)
-            db[self.country_code] = value
-            return value
+        key = (self.country_code, category)
+        if key in _CATEGORY_VALUES:
+            return _CATEGORY_VALUES[key]
+        with _CATEGORY_LOCK:
+            with shelve.open(f"caches/{category}_cache") as db:
+                if self.country_code in db:
+                    value = db[self.country_code]
+                    _CATEGORY_VALUES[key] = value
+                    return value
+        # fetch outside the lock so one slow request does not stall every
+        # other thread's cache lookups
+        value = self.get_category(category)
+        with _CATEGORY_LOCK:
+            with shelve.open(f"caches/{category}_cache") as db:
+                db[self.country_code] = value
+        _CATEGORY_VALUES[key] = value
+        return value
+
+    @timer
+    def get_all_categories(self) -> tuple[float, float, float]:
+        """Gets the GDP, PLI and tourism expenditure of the country.
+            The three categories are independent API lookups, so they are
+            fetched concurrently instead of one after the other.
+
+        Returns
+        ----------
+        tuple[float, float, float]
+            The GDP per capita, Price Level Index and Tourism Expenditure.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            gdp, pli, tourism = executor.map(
+                self.get_category_with_cache,
+                (GDP_PER_CAPITA_USD, PRICE_LEVEL_INDEX, TOURISM_EXPENDITURE),
+            )
+        return gdp, pli, tourism
 
     @timer
     def get_gdp(self):
@@ -3,8 +3,12 @@
 from datetime import date
 from unittest import TestCase, main
 
+import numpy as np
+
 from code.demand_functions import (
     _compute_base_demand,
+    _compute_route_demand,
+    _compute_route_demand_batch,
     _get_business_class_multiplier,
     _get_economy_class_multiplier,
     _get_first_class_multiplier,
@@ -57,6 +61,32 @@ class TestPassengerDemand(TestCase):
         )
         self.assertLessEqual(ecm, 0.8)
 
+    def test_batch_demand_matches_scalar_path(self):
+        """Checks that the batch kernel agrees with the scalar demand path."""
+        distances = [0, 100, 1000, 8000]
+        expected = [_compute_route_demand(d, **self.stats) for d in distances]
+        results = _compute_route_demand_batch(
+            np.array(distances, dtype=float),
+            np.array([self.stats["populations"][:2]] * len(distances)),
+            np.array([self.stats["gdps"][:2]] * len(distances)),
+            np.array([self.stats["plis"][:2]] * len(distances)),
+            np.array([self.stats["tourism_expenditures"][:2]] * len(distances)),
+        )
+        for i, scalar_values in enumerate(expected):
+            for batch_array, scalar_value in zip(results, scalar_values):
+                self.assertAlmostEqual(
+                    float(batch_array[i]),
+                    scalar_value,
+                    delta=abs(scalar_value) * 1e-4 + 1e-6,
+                )
+
+    def test_batch_demand_handles_empty_batches(self):
+        """Checks that an empty batch yields empty arrays instead of raising."""
+        empty = np.array([])
+        results = _compute_route_demand_batch(empty, empty, empty, empty, empty)
+        for batch_array in results:
+            self.assertEqual(batch_array.size, 0)
+
     def test_correctness_of_seasonality_factor(self):
         """Checks that the seasonality factor changes correctly with the month."""
         self.assertEqual(